@@ -11,14 +11,16 @@ Instantiate `DiscordBot` with a configuration and call `start_bot()` to run the
 """
 
 from typing import Any, Dict, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime, timezone, timedelta
-from collections import Counter
 from discord.ext import tasks
 
 import discord
 import logging
 import asyncio
+import contextlib
+import json
+import os
 import wandb
 
 from discord.ext import commands
@@ -26,7 +28,12 @@ from discord.ext import commands
 from .config import load_config, setup_logger
 from .competition_config import CompetitionConfigManager, CompetitionConfig
 
+_DATE_FMT = "%Y.%m.%d %H:%M UTC"
+_MAX_EMBEDS_PER_MESSAGE = 10  # Discord limit
+
 class DiscordAnnouncementData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     competition_id: str
     competition_date: datetime
     dataset_size: int
@@ -40,12 +47,17 @@ class DiscordBot(commands.Bot):
         self.config: Dict[str, Any] = config or load_config()
         self.logger: logging.Logger = logger or setup_logger(self.config)
         self.config_manager = CompetitionConfigManager(self, self.logger, self.config)
-        self.category_creation_lock = asyncio.Lock()
 
-        wandb.login(key=self.config["WANDB_API_KEY"])
-        self.wandb_api = wandb.Api()
-        self.last_competitions_announcements = {}
-        # load last competition announcements
+        # W&B login is blocking, it is done lazily in a thread on first use
+        self.wandb_api: Optional[wandb.Api] = None
+        self._wandb_api_lock = asyncio.Lock()
+        self._announcements_state_file: str = self.config.get("ANNOUNCEMENTS_STATE_FILE", "state.json")
+        self.last_competitions_announcements: Dict[str, datetime] = self._load_announcements_state()
+        self._guild_id: int = int(self.config["GUILD_ID"])
+        self._primary_guild: Optional[discord.Guild] = None
+        self._channel_index: dict[int, dict[str, discord.TextChannel]] = {}
+        self._inflight: dict[tuple[str, datetime], asyncio.Future] = {}
+        self._last_load_ok: bool = False
 
         # Define intents
         intents = discord.Intents.default()
@@ -69,90 +81,120 @@ class DiscordBot(commands.Bot):
         self.logger.info(f"Bot connected as {self.user}")
         for guild in self.guilds:
             self.logger.info(f"Connected to guild: {guild.name}")
-        await self.update_config_and_announce_results.start()
+            self._index_text_channels(guild)
+        self._primary_guild = self.get_guild(self._guild_id)
+        # on_ready fires again after reconnects, the loop must only be started once
+        if not self.update_config_and_announce_results.is_running():
+            self.update_config_and_announce_results.start()
+
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        self._index_text_channels(channel.guild)
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._index_text_channels(channel.guild)
+
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        self._index_text_channels(after.guild)
+
+    def _index_text_channels(self, guild: discord.Guild) -> dict[str, discord.TextChannel]:
+        """
+        Rebuilds the name -> text channel index of a guild. The first channel
+        wins on duplicate names, same as discord.utils.get.
+        """
+        index = {channel.name: channel for channel in reversed(guild.text_channels)}
+        self._channel_index[guild.id] = index
+        return index
 
     @tasks.loop(minutes=10)  # Adjust the interval as needed
     async def update_config_and_announce_results(self) -> None:
         """
         Periodically updates the competition configurations from remote repo.
         """
+        await self._tick()
+
+    async def _tick(self) -> None:
+        """
+        Single iteration of the config update and results announcement.
+        """
         try:
             self.logger.info("Updating competition config...")
             await self.config_manager.load_config_from_remote_repo()
+            self._last_load_ok = True
             self.logger.info("Update completed.")
         except Exception as e:
+            self._last_load_ok = False
             self.logger.exception(f"Unexpected error during remote repo synchronization: {e}")
 
+        if not self._last_load_ok or not self.config_manager.competition_configs:
+            self.logger.info("No valid competition config available, skipping announcements.")
+            return
+
         try:
             self.logger.info("Announcing competition results...")
-            for competition in self.config_manager.competition_configs:
-                await self.announce_competition_results(competition)
+            await self.announce_competition_results(self.config_manager.competition_configs)
             self.logger.info("Announcement completed.")
         except Exception as e:
             self.logger.exception(f"Unexpected error during competition announcement: {e}")
 
     async def get_competition_data(self, competition: CompetitionConfig) -> DiscordAnnouncementData:
-        entity = "safe-scan-ai"
-        project = competition.competition_id
-
-        # Convert time strings to datetime objects
-        competition_schedule = competition.evaluation_times
+        competition_schedule = competition.evaluation_time_objs
         latest_executed_competition = await self.get_latest_executed_competition(competition_schedule)
-        announcement_threshold = datetime.now(timezone.utc) - timedelta(minutes=15)
         latest_executed_announcement = self.last_competitions_announcements.get(competition.competition_id, None)
 
         # getting the latest non-announced runs according to the config schedule
         if latest_executed_competition == latest_executed_announcement:
             self.logger.info(f"Competition {competition.competition_id} already announced")
             return None
-        
-        print("latest comp: ", latest_executed_competition, "latest announcement: ", latest_executed_announcement, "threashold: ", announcement_threshold)
+
+        # overlapping calls for the same competition run share a single W&B fetch
+        key = (competition.competition_id, latest_executed_competition)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_competition_data(competition, latest_executed_competition))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _fetch_competition_data(self, competition: CompetitionConfig,
+                                      latest_executed_competition: datetime) -> Optional[DiscordAnnouncementData]:
+        entity = "safe-scan-ai"
+        project = competition.competition_id
+        announcement_threshold = datetime.now(timezone.utc) - timedelta(minutes=15)
+
+        self.logger.debug(f"Fetching results for competition {competition.competition_id}, "
+                          f"latest run: {latest_executed_competition}, threshold: {announcement_threshold}")
+        # only scored miner runs and validator vote runs are relevant,
+        # let W&B filter and sort them server-side
         filters = {
-        "Created": {
+        "created_at": {
             "$gte": latest_executed_competition.isoformat(),
             "$lt": announcement_threshold.isoformat()
-            }
+            },
+        "$or": [
+            {"summary_metrics.score": {"$exists": True}},
+            {"summary_metrics.winning_hotkey": {"$exists": True}},
+            ],
         }
 
-        runs = self.wandb_api.runs(f"{entity}/{project}", filters=filters)
-        if runs is None:
+        # the W&B client is blocking, keep the event loop free while pages are fetched
+        wandb_api = await self._wandb_api()
+        collected = await asyncio.to_thread(self._collect_runs_sync, wandb_api, entity, project, filters)
+        if collected is None:
             self.logger.info(f"No runs found for competition {competition.competition_id}")
             return None
-        
-        tested_models_amount = 0
-        validators_choices = []
-        created_at: datetime
-        for run in runs:
-            for key, value in run.summary.items():
-                # TODO: refactor to cases?
-                if key == "score":
-                    tested_models_amount += 1
-                    continue
-                if key == "winning_hotkey":
-                    validators_choices.append(value)
-                if key == "Created":
-                    created_at = value
-
-        validators_choices_counter = Counter(validators_choices)
-        if not validators_choices_counter:
+        rows, winning_hotkey = collected
+
+        tested_models_amount = sum(1 for _, _, score, _ in rows if score is not None)
+        if winning_hotkey is None:
             self.logger.error(f"No validators choices found for competition {competition.competition_id}")
             return None
         
-        winning_hotkey = validators_choices_counter.most_common(1)[0][0]
-        run = self.wandb_api.runs(f"{entity}/{project}", filters={"Created": {"$gte": (created_at - timedelta(minutes=15)).isoformat(),
-                                                                                  "$lt": (created_at + timedelta(minutes=15)).isoformat()},
-                                                                                    "miner_hotkey": winning_hotkey})[0]
-        
-        dataset_size: int
-        score: float
-        for key, value in run.summary.items():
-            # TODO: refactor to cases?
-            if key == "tested_entries":
-                dataset_size = value
-            if key == "score":
-                score = value
-        
-        # self.last_competitions_announcements[competition.competition_id] = latest_executed_competition
+        # rows are newest-first, stop at the first scored run of the winning miner
+        winner_row = next((row for row in rows if row[0] == winning_hotkey and row[2] is not None), None)
+        if winner_row is None:
+            self.logger.error(f"No run found for winning hotkey {winning_hotkey} in competition {competition.competition_id}")
+            return None
+        _, _, score, dataset_size = winner_row
 
         announcement_data = DiscordAnnouncementData(competition_id=competition.competition_id,
                                         competition_date=latest_executed_competition,
@@ -162,61 +204,164 @@ class DiscordBot(commands.Bot):
                                                 score=score)
         return announcement_data
 
-    # TODO: refactor to meet the requirements
-    async def create_discord_message(self, announcement_data: DiscordAnnouncementData) -> str:
-        message = f"Competition {announcement_data.competition_id} has finished.\n"
-        message += f"Date: {announcement_data.competition_date}\n"
-        message += f"Dataset size: {announcement_data.dataset_size}\n"
-        message += f"Tested models amount: {announcement_data.tested_models_amount}\n"
-        message += f"Winning hotkey: {announcement_data.winning_hotkey}\n"
-        message += f"Score: {announcement_data.score}\n"
-        return message
-
-    async def announce_competition_results(self, competition: CompetitionConfig) -> None:
-        announcement_data = await self.get_competition_data(competition)
-        if announcement_data is None:
+    async def _wandb_api(self) -> wandb.Api:
+        """
+        Returns the W&B API client, logging in on first use.
+        """
+        async with self._wandb_api_lock:
+            if self.wandb_api is None:
+                def login() -> wandb.Api:
+                    wandb.login(key=self.config["WANDB_API_KEY"])
+                    return wandb.Api()
+                self.wandb_api = await asyncio.to_thread(login)
+        return self.wandb_api
+
+    def _collect_runs_sync(self, wandb_api: wandb.Api, entity: str, project: str,
+                           filters: Dict[str, Any]) -> Optional[tuple[list[tuple[Any, Any, Any, Any]], Optional[str]]]:
+        """
+        Fetches the runs matching the filters and returns a
+        (miner_hotkey, winning_hotkey, score, tested_entries) row per run together
+        with the hotkey most voted for by the validators.
+        Runs synchronously, meant to be called through asyncio.to_thread.
+        """
+        runs = wandb_api.runs(f"{entity}/{project}", filters=filters, order="-created_at", per_page=100)
+        if runs is None:
+            return None
+
+        # single pass over the paginated runs, summary values read by key,
+        # validators' votes are tallied with a running maximum
+        rows = []
+        counts: dict[str, int] = {}
+        best_key, best_count = None, 0
+        for run in runs:
+            s = run.summary
+            winning_hotkey = s.get("winning_hotkey")
+            rows.append((s.get("miner_hotkey"), winning_hotkey, s.get("score"), s.get("tested_entries")))
+            if winning_hotkey:
+                count = counts.get(winning_hotkey, 0) + 1
+                counts[winning_hotkey] = count
+                if count > best_count:
+                    best_key, best_count = winning_hotkey, count
+        return rows, best_key
+
+    @staticmethod
+    def _format_embed(announcement_data: DiscordAnnouncementData) -> discord.Embed:
+        embed = discord.Embed(title=f"Competition {announcement_data.competition_id} has finished")
+        embed.add_field(name="Date", value=announcement_data.competition_date.strftime(_DATE_FMT), inline=False)
+        embed.add_field(name="Dataset size", value=str(announcement_data.dataset_size))
+        embed.add_field(name="Tested models amount", value=str(announcement_data.tested_models_amount))
+        embed.add_field(name="Winning hotkey", value=announcement_data.winning_hotkey, inline=False)
+        embed.add_field(name="Score", value=str(announcement_data.score))
+        return embed
+
+    async def announce_competition_results(self, competitions: list[CompetitionConfig]) -> None:
+        # competitions don't share state, fetch their results concurrently
+        results = await asyncio.gather(
+            *(self.get_competition_data(competition) for competition in competitions),
+            return_exceptions=True,
+        )
+        announcements: list[DiscordAnnouncementData] = []
+        for competition, result in zip(competitions, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Fetching results failed for competition {competition.competition_id}: {result}",
+                    exc_info=result,
+                )
+            elif result is not None:
+                announcements.append(result)
+        if not announcements:
             return
-        message = await self.create_discord_message(announcement_data)
-        print(message)
-        # await self.send_message_to_channel("competition-announcements", message)
 
-    async def get_latest_executed_competition(self, competition_schedule: list[str]) -> datetime:
-        # Convert time strings to datetime objects
+        # one embed per competition, sent together in as few messages as possible
+        for start in range(0, len(announcements), _MAX_EMBEDS_PER_MESSAGE):
+            chunk = announcements[start:start + _MAX_EMBEDS_PER_MESSAGE]
+            await self.send_embeds_to_channel(
+                "competition-announcements", [self._format_embed(announcement_data) for announcement_data in chunk]
+            )
+            # runs are recorded as announced as soon as their message was posted
+            for announcement_data in chunk:
+                self.last_competitions_announcements[announcement_data.competition_id] = announcement_data.competition_date
+            self._save_announcements_state()
+
+    def _load_announcements_state(self) -> Dict[str, datetime]:
+        """
+        Loads the last announced competition runs persisted by previous bot runs.
+        """
+        path = self._announcements_state_file
+        try:
+            with open(path, "r") as state_file:
+                state = json.load(state_file)
+            return {competition_id: datetime.fromisoformat(date) for competition_id, date in state.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.exception(f"Could not load announcements state from {path}: {e}")
+            return {}
+
+    def _save_announcements_state(self) -> None:
+        """
+        Persists the last announced competition runs, replacing the state file atomically.
+        """
+        path = self._announcements_state_file
+        state = {competition_id: date.isoformat() for competition_id, date in self.last_competitions_announcements.items()}
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w") as state_file:
+                json.dump(state, state_file)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.exception(f"Could not save announcements state to {path}: {e}")
+
+    async def get_latest_executed_competition(self, competition_schedule: tuple[tuple[int, int], ...]) -> datetime:
         current_time = datetime.now(timezone.utc)
         time_objects = [
-            datetime.strptime(time_str, "%H:%M").replace(
-                year=current_time.year, month=current_time.month, day=current_time.day, tzinfo=timezone.utc
-            )
-            for time_str in competition_schedule
+            current_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            for hour, minute in competition_schedule
         ]
 
         past_times = [time for time in time_objects if time <= current_time]
         # Find the latest past time for today
         if past_times:
-            latest_past_time = max(past_times)
-            return latest_past_time
-        else:
-            # If no past times today, get the latest time from yesterday
-            time_objects_yesterday = [
-                datetime.strptime(time_str, "%H:%M").replace(
-                    year=current_time.year, month=current_time.month, day=current_time.day - 1, tzinfo=timezone.utc
-                )
-                for time_str in competition_schedule
-            ]
-            latest_past_time_yesterday = max(time_objects_yesterday)
-            return latest_past_time_yesterday
+            return max(past_times)
+        # If no past times today, get the latest time from yesterday
+        return max(time_objects) - timedelta(days=1)
 
     async def send_message_to_channel(self, channel_name: str, message: str) -> None:
-        await self.wait_until_ready()
-        guild = await self._get_guild_or_raise(int(self.config["GUILD_ID"]))
-        channel = discord.utils.get(guild.text_channels, name=channel_name)
+        channel = await self._get_channel_or_raise(channel_name)
+        await channel.send(message)
+
+    async def send_embeds_to_channel(self, channel_name: str, embeds: list[discord.Embed]) -> None:
+        """
+        Sends the embeds as a single message, at most _MAX_EMBEDS_PER_MESSAGE of them.
+        """
+        if len(embeds) > _MAX_EMBEDS_PER_MESSAGE:
+            raise ValueError(f"Cannot send more than {_MAX_EMBEDS_PER_MESSAGE} embeds in one message")
+        channel = await self._get_channel_or_raise(channel_name)
+        await channel.send(embeds=embeds)
+
+    async def _get_channel_or_raise(self, channel_name: str) -> discord.TextChannel:
+        # the guild is cached in on_ready, callers only send once the bot is ready
+        guild = self._primary_guild or await self._get_guild_or_raise(self._guild_id)
+        index = self._channel_index.get(guild.id)
+        if index is None:
+            index = self._index_text_channels(guild)
+        channel = index.get(channel_name)
         if channel is None:
             self.logger.error(f"Channel named '{channel_name}' not found in guild '{guild.name}'")
             raise ValueError(f"Channel named '{channel_name}' not found in guild '{guild.name}'")
-        await channel.send(message)
-  
+        return channel
+
     async def close(self):
-        await self.update_config_and_announce_results()
+        # wait for a cancelled iteration to unwind so the final tick doesn't overlap with it
+        task = self.update_config_and_announce_results.get_task()
+        self.update_config_and_announce_results.cancel()
+        if task is not None and task is not asyncio.current_task():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        # the final tick can only post announcements once the guild is available
+        if self.is_ready():
+            await self._tick()
+        await self.config_manager.close()
         await super().close()
 
     async def _get_guild_or_raise(self, guild_id: int) -> discord.Guild:
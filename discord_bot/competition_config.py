@@ -1,17 +1,32 @@
-from pydantic import BaseModel, Field
-from typing import Any, Dict
+from pydantic import Field, TypeAdapter, ValidationError, model_validator
+from pydantic.dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from typing import Any, Dict, Optional
 import aiohttp
 import logging
 import discord
-import json
+import orjson
 
-class CompetitionConfig(BaseModel):
+@dataclass(slots=True)
+class CompetitionConfig:
     competition_id: str = Field(..., min_length=1)
     category: str = Field(..., min_length=1)
     evaluation_times: list[str] = Field(..., min_length=1)
     dataset_hf_repo: str = Field(..., min_length=1)
     dataset_hf_filename: str = Field(..., min_length=1)
     dataset_hf_repo_type: str = Field(..., min_length=1)
+    # evaluation times parsed to (hour, minute) tuples, computed once per config
+    evaluation_time_objs: tuple[tuple[int, int], ...] = field(init=False, default=(), repr=False)
+
+    @model_validator(mode="after")
+    def parse_evaluation_times(self) -> "CompetitionConfig":
+        # raises ValueError on anything that is not "HH:MM"
+        parsed = (datetime.strptime(time_str, "%H:%M") for time_str in self.evaluation_times)
+        self.evaluation_time_objs = tuple((time.hour, time.minute) for time in parsed)
+        return self
+
+_COMPETITION_CONFIGS_ADAPTER = TypeAdapter(list[CompetitionConfig])
 
 class CompetitionConfigManager:
     """
@@ -22,34 +37,50 @@ class CompetitionConfigManager:
             self.bot = bot
             self.config = config
             self.logger = logger
-            self.competition_configs: list[CompetitionConfig]
+            self.competition_configs: list[CompetitionConfig] = []
+            self._config_etag: Optional[str] = None
+            self._session: Optional[aiohttp.ClientSession] = None
     
     async def get_competition_configs(self, logger: logging.Logger, config_data: list[dict[str, Any]]) -> list[CompetitionConfig]:
-        competitions = []
-        for competition in config_data:
-            try:
-                competition_config = CompetitionConfig(**competition)
-                competitions.append(competition_config)
-            except Exception as e:
-                logger.exception(f"Error for competition {competition.get('competition_id', 'unknown')}: {e}")
-                raise
-        return competitions
+        try:
+            return _COMPETITION_CONFIGS_ADAPTER.validate_python(config_data)
+        except ValidationError as e:
+            for error in e.errors():
+                index = error["loc"][0] if error["loc"] else None
+                competition = config_data[index] if isinstance(index, int) else {}
+                competition_id = competition.get("competition_id", "unknown") if isinstance(competition, dict) else "unknown"
+                logger.error(f"Error for competition {competition_id}: {error['msg']} at {error['loc']}")
+            raise
 
     async def load_config_from_remote_repo(self) -> None:
         """
         Fetches the configuration from a remote GitHub repository.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.config["COMPETITION_CONFIG_URL"]) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    try:
-                        json_config = json.loads(text)
-                        self.competition_configs = await self.get_competition_configs(self.logger, json_config)
-                        self.logger.info("Configuration fetched and processed successfully.")
-                    except Exception as e:
-                        self.logger.exception(f"Configuration processing failed: {e}")
-                        raise
-                else:
-                    self.logger.error(f"Failed to fetch configuration. Status code: {response.status}")
-                    raise ValueError("Could not fetch configuration from remote repo.")
\ No newline at end of file
+        headers = {"If-None-Match": self._config_etag} if self._config_etag else {}
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        async with self._session.get(self.config["COMPETITION_CONFIG_URL"], headers=headers) as response:
+            if response.status == 304:
+                self.logger.debug("Configuration not modified since last fetch.")
+                return
+            if response.status == 200:
+                body = await response.read()
+                try:
+                    json_config = orjson.loads(body)
+                    self.competition_configs = await self.get_competition_configs(self.logger, json_config)
+                    self._config_etag = response.headers.get("ETag")
+                    self.logger.info("Configuration fetched and processed successfully.")
+                except Exception as e:
+                    self.logger.exception(f"Configuration processing failed: {e}")
+                    raise
+            else:
+                self.logger.error(f"Failed to fetch configuration. Status code: {response.status}")
+                raise ValueError("Could not fetch configuration from remote repo.")
+
+    async def close(self) -> None:
+        """
+        Closes the HTTP session used for fetching the remote configuration.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
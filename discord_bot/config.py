@@ -29,6 +29,7 @@ def load_config() -> Dict[str, str]:
         "COMPETITION_CONFIG_URL": os.getenv("COMPETITION_CONFIG_URL"),
         "BOT_NAME": os.getenv("BOT_NAME"),
         "WANDB_API_KEY": os.getenv("WANDB_API_KEY"),
+        "ANNOUNCEMENTS_STATE_FILE": os.getenv("ANNOUNCEMENTS_STATE_FILE", "state.json"),
         # Add more configuration options as needed
     }
 